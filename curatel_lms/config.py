@@ -9,6 +9,7 @@ class AppConfig:
     WINDOW_WIDTH = 1920
     WINDOW_HEIGHT = 1080
     WINDOW_TITLE = "Curatel - Library Management System"
+    PESO = "\u20B1"                 # Currency sign for fines
     
     # DIALOG DIMENSIONS
     DIALOG_WIDTH = 800
@@ -37,10 +38,12 @@ class AppConfig:
     
     # Search bar dimensions
     SEARCH_HEIGHT = 40
+    SEARCH_DEBOUNCE_MS = 150        # Typing pause before search refilters
 
     # TABLE DIMENSIONS
     TABLE_HEIGHT = 400
     TABLE_WIDTH = 685
+    ROW_HEIGHT = 36                 # Fixed table row height
     
     # COLOR PALETTE
     COLORS = {
@@ -107,6 +110,32 @@ class AppConfig:
             }
         """,
         
+        # Calendar button beside date inputs
+        'calendar_button': """
+            QToolButton {
+                background-color: #8B7E66;
+                color: white;
+                border: 2px solid white;
+                border-radius: 10px;
+                font-size: 13px;
+            }
+            QToolButton:hover {
+                background-color: #6B5E46;
+            }
+        """,
+        
+        # Calendar popup for date inputs
+        'calendar_popup': """
+            QCalendarWidget QWidget {
+                background-color: white;
+                color: black;
+            }
+            QCalendarWidget QToolButton {
+                color: black;
+                font-family: Montserrat;
+            }
+        """,
+        
         # Search input
         'search_input': """
             QLineEdit {
@@ -221,7 +250,7 @@ class AppConfig:
         
         # Table with corner button
         'table_with_corner': """
-            QTableWidget {
+            QTableView {
                 border: 1px solid #8B7E66;
                 gridline-color: #8B7E66;
                 background-color: white;
@@ -240,10 +269,10 @@ class AppConfig:
             QHeaderView::section:hover {
                 background-color: #7A6D55;
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #D9CFC2;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #C9B8A8;
             }
             QTableCornerButton::section {
@@ -292,6 +321,37 @@ class AppConfig:
             background: transparent;
             text-decoration: underline;
         """,
+        
+        # Application-wide sheet: message boxes and named dialog widgets
+        'global': """
+            QMessageBox {
+                background-color: #3C2A21;
+                color: white;
+            }
+            QMessageBox QLabel {
+                color: white;
+            }
+            QMessageBox QPushButton {
+                background-color: #8B7E66;
+                color: white;
+                border: none;
+                padding: 5px 15px;
+                border-radius: 5px;
+            }
+            QMessageBox QPushButton:hover {
+                background-color: #7A6D55;
+            }
+            QWidget#confirmFrame {
+                background-color: #8B7E66;
+                border: none;
+            }
+            QLabel#confirmMsg {
+                font-family: Montserrat;
+                font-size: 20px;
+                border: none;
+                color: white;
+            }
+        """,
     }
     
     # BUTTON STYLE BUILDERS
@@ -329,6 +389,35 @@ class AppConfig:
             AppConfig.COLORS['button_red_hover']
         )
     
+    @staticmethod
+    def get_dialog_style():
+        # Dialog background plus green/red buttons keyed by cssClass property
+        return f"""
+            * {{
+                background-color: {AppConfig.COLORS['bg_dialog']};
+            }}
+            QPushButton[cssClass="green"], QPushButton[cssClass="red"] {{
+                color: white;
+                border: none;
+                border-radius: 15px;
+                font-family: Montserrat;
+                font-size: 18px;
+                font-weight: bold;
+            }}
+            QPushButton[cssClass="green"] {{
+                background-color: {AppConfig.COLORS['button_green']};
+            }}
+            QPushButton[cssClass="green"]:hover {{
+                background-color: {AppConfig.COLORS['button_green_hover']};
+            }}
+            QPushButton[cssClass="red"] {{
+                background-color: {AppConfig.COLORS['button_red']};
+            }}
+            QPushButton[cssClass="red"]:hover {{
+                background-color: {AppConfig.COLORS['button_red_hover']};
+            }}
+        """
+    
     # DATA CATEGORIES AND OPTIONS
     BOOK_CATEGORIES = [
         "All", "Adventure", "Art", "Biography", "Business",
@@ -369,6 +458,11 @@ class AppConfig:
         'password': '',
         'database': 'db_library'
     }
+    QUERY_CACHE_TTL = 5.0           # Seconds a cached SELECT result stays fresh
+    QUERY_CACHE_SIZE = 32           # Most cached SELECT results kept at once
+    FETCH_CHUNK_SIZE = 200          # Rows per streamed batch
+    CIRCULATION_PAGE_SIZE = 500     # Transactions per loaded page
+    SERVER_FILTER_THRESHOLD = 2000  # Loaded transactions above which filters run in SQL
     
     # QUERY CONSTANTS
     QUERIES = {
@@ -2,9 +2,12 @@
 
 # Manages MySQL connections and performs create, read, update, and delete operations with error handling
 
+import threading
+import time
 import mysql.connector
 from mysql.connector import Error
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Iterator
+from curatel_lms.config import AppConfig
 
 class Database:
     # MySQL connection manager: safely executes queries and fetches results.
@@ -17,6 +20,14 @@ class Database:
         self.user = user
         self.password = password
         self.database = database
+        self.last_insert_id = None
+        self._lock = threading.RLock()
+        self._prepared = {}
+        self._prepared_supported = True
+        self._query_cache = {}
+        self._cache_epoch = 0
+        self._stream_connection = None
+        self._stream_lock = threading.Lock()
         print(f"[INFO] Database initialized: {database}")
     
     def connect(self) -> bool:
@@ -30,6 +41,8 @@ class Database:
             )
             
             if self.connection.is_connected():
+                self._prepared = {}
+                self._invalidate_cache()
                 print(f"[OK] Connected to database: {self.database}")
                 return True
             
@@ -43,79 +56,281 @@ class Database:
     
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> bool:
         # Run INSERT/UPDATE/DELETE; return success status.
-        if not self._is_connected():
-            return False
+        with self._lock:
+            if not self._is_connected():
+                return False
             
-        try:
-            cursor = self.connection.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+            self._invalidate_cache()
+            try:
+                cursor = self.connection.cursor()
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
             
-            self.connection.commit()
-            cursor.close()
-            print(f"[OK] Query executed: {cursor.rowcount} rows affected")
-            return True
+                self.connection.commit()
+                cursor.close()
+                print(f"[OK] Query executed: {cursor.rowcount} rows affected")
+                return True
             
-        except Error as e:
-            print(f"[ERROR] Query execution failed: {e}")
-            if self.connection:
-                self.connection.rollback()
-            return False
-    
+            except Error as e:
+                print(f"[ERROR] Query execution failed: {e}")
+                if self.connection:
+                    self.connection.rollback()
+                return False
+
+    def execute_transaction(self, statements: List[Tuple[str, Optional[Tuple]]]) -> bool:
+        # Run several writes under one commit; roll back all on failure.
+        with self._lock:
+            if not self._is_connected():
+                return False
+
+            self._invalidate_cache()
+            try:
+                cursor = self.connection.cursor()
+                self.last_insert_id = None
+                for query, params in statements:
+                    if params:
+                        cursor.execute(query, params)
+                    else:
+                        cursor.execute(query)
+                    if cursor.lastrowid:
+                        self.last_insert_id = cursor.lastrowid
+
+                self.connection.commit()
+                cursor.close()
+                print(f"[OK] Transaction committed: {len(statements)} statements")
+                return True
+
+            except Error as e:
+                print(f"[ERROR] Transaction failed: {e}")
+                if self.connection:
+                    self.connection.rollback()
+                return False
+
     def fetch_all(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
         # Run SELECT; return all results as list of dicts.
-        if not self._is_connected():
-            return []
+        with self._lock:
+            if not self._is_connected():
+                return []
             
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+            try:
+                results = self._select_all(query, params)
+                print(f"[OK] Fetched {len(results)} records")
+                return results
             
-            results = cursor.fetchall()
-            cursor.close()
+            except Error as e:
+                print(f"[ERROR] Fetch all failed: {e}")
+                return []
+    
+    def fetch_all_checked(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
+        # Run SELECT; return all results, raising Error instead of returning [] on failure.
+        with self._lock:
+            if not self._is_connected():
+                raise Error("No active database connection")
+
+            try:
+                results = self._select_all(query, params)
+            except Error as e:
+                print(f"[ERROR] Fetch all failed: {e}")
+                raise
+
             print(f"[OK] Fetched {len(results)} records")
             return results
-            
-        except Error as e:
-            print(f"[ERROR] Fetch all failed: {e}")
-            return []
+    
+    def fetch_iter(self, query: str, params: Optional[Tuple] = None, chunksize: int = 200,
+                   ttl: Optional[float] = None) -> Iterator[List[Dict[str, Any]]]:
+        # Run SELECT on a dedicated connection's unbuffered cursor; yield results in chunks as they arrive.
+        # With a ttl, a fresh cached result is replayed instead and a complete stream is cached.
+        # Errors propagate to the caller; rows left unread are drained so the connection stays usable.
+        key = (query, params)
+        epoch = self._cache_epoch
+        if ttl:
+            cached = self._cache_get(key, ttl)
+            if cached is not None:
+                print(f"[OK] Served {len(cached)} cached records")
+                for start in range(0, len(cached), chunksize):
+                    yield cached[start:start + chunksize]
+                return
+
+        with self._stream_lock:
+            cursor = self._open_stream_connection().cursor(dictionary=True)
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                streamed = []
+                while True:
+                    rows = cursor.fetchmany(chunksize)
+                    if not rows:
+                        break
+                    streamed.extend(rows)
+                    yield rows
+                if ttl and epoch == self._cache_epoch:
+                    self._cache_put(key, streamed, ttl)
+                print(f"[OK] Streamed {len(streamed)} records")
+
+            except Error as e:
+                print(f"[ERROR] Fetch iter failed: {e}")
+                raise
+
+            finally:
+                try:
+                    cursor.fetchall()
+                except Error:
+                    pass
+                cursor.close()
+    
+    def fetch_all_cached(self, query: str, params: Optional[Tuple] = None,
+                         ttl: float = AppConfig.QUERY_CACHE_TTL) -> List[Dict[str, Any]]:
+        # Run SELECT through a short-lived, size-capped result cache; any write clears it.
+        # Errors are raised, never cached.
+        key = (query, params)
+        with self._lock:
+            cached = self._cache_get(key, ttl)
+            if cached is not None:
+                print(f"[OK] Served {len(cached)} cached records")
+                return cached
+            results = self.fetch_all_checked(query, params)
+            self._cache_put(key, results, ttl)
+            return results
+
+    def _cache_get(self, key: Tuple, ttl: float) -> Optional[List[Dict[str, Any]]]:
+        # Return a cached result younger than ttl, or None.
+        with self._lock:
+            cached = self._query_cache.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            return None
+
+    def _cache_put(self, key: Tuple, results: List[Dict[str, Any]], ttl: float) -> None:
+        # Store a result, dropping expired entries and the oldest one past the size cap.
+        with self._lock:
+            now = time.monotonic()
+            self._query_cache = {
+                cached_key: entry for cached_key, entry in self._query_cache.items()
+                if now - entry[0] < ttl
+            }
+            if len(self._query_cache) >= AppConfig.QUERY_CACHE_SIZE:
+                del self._query_cache[next(iter(self._query_cache))]
+            self._query_cache[key] = (now, results)
+
+    def _invalidate_cache(self) -> None:
+        # Drop cached results; streams started before this will not store theirs.
+        with self._lock:
+            self._query_cache.clear()
+            self._cache_epoch += 1
+
+    def _open_stream_connection(self):
+        # Return the streaming connection, opening it on first use.
+        # Autocommit keeps each stream off a stale REPEATABLE READ snapshot.
+        if self._stream_connection is None or not self._stream_connection.is_connected():
+            self._stream_connection = mysql.connector.connect(
+                host=self.host,
+                user=self.user,
+                password=self.password,
+                database=self.database,
+                autocommit=True
+            )
+        return self._stream_connection
     
     def fetch_one(self, query: str, params: Optional[Tuple] = None) -> Optional[Dict[str, Any]]:
         # Run SELECT; return one result as dict or None.
-        if not self._is_connected():
-            return None
+        with self._lock:
+            if not self._is_connected():
+                return None
             
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+            try:
+                cursor = self.connection.cursor(dictionary=True)
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
             
-            result = cursor.fetchone()
-            cursor.close()
+                result = cursor.fetchone()
+                cursor.close()
             
-            if result:
-                print("[OK] Record fetched successfully")
-            else:
-                print("[INFO] No record found")
+                if result:
+                    print("[OK] Record fetched successfully")
+                else:
+                    print("[INFO] No record found")
             
-            return result
+                return result
             
-        except Error as e:
-            print(f"[ERROR] Fetch one failed: {e}")
-            return None
+            except Error as e:
+                print(f"[ERROR] Fetch one failed: {e}")
+                return None
     
+    def fetch_one_prepared(self, query: str, params: Tuple) -> Optional[Dict[str, Any]]:
+        # Run a repeated single-row SELECT on a statement prepared once per connection.
+        with self._lock:
+            if not self._prepared_supported:
+                return self.fetch_one(query, params)
+            if not self._is_connected():
+                return None
+
+            try:
+                cursor = self._prepared.get(query)
+                if cursor is None:
+                    try:
+                        cursor = self.connection.cursor(prepared=True, dictionary=True)
+                    except (ValueError, TypeError) as e:
+                        # Older connectors have no prepared dictionary cursor
+                        print(f"[INFO] Prepared statements unavailable, using plain queries: {e}")
+                        self._prepared_supported = False
+                        return self.fetch_one(query, params)
+                    self._prepared[query] = cursor
+                cursor.execute(query, params)
+                result = cursor.fetchone()
+                try:
+                    # Drain any extra rows; an exhausted result set may raise here
+                    cursor.fetchall()
+                except Error:
+                    pass
+
+                if result:
+                    print("[OK] Record fetched successfully")
+                else:
+                    print("[INFO] No record found")
+
+                return result
+
+            except Error as e:
+                print(f"[ERROR] Prepared fetch failed, retrying as a plain query: {e}")
+                stale = self._prepared.pop(query, None)
+                if stale is not None:
+                    try:
+                        stale.close()
+                    except Error:
+                        pass
+                return self.fetch_one(query, params)
+
     def close(self) -> None:
         # Close connection if open.
         if self.connection and self.connection.is_connected():
+            for cursor in self._prepared.values():
+                cursor.close()
+            self._prepared = {}
             self.connection.close()
             print("[INFO] Database connection closed")
+        with self._stream_lock:
+            if self._stream_connection and self._stream_connection.is_connected():
+                self._stream_connection.close()
+            self._stream_connection = None
+    
+    def _select_all(self, query: str, params: Optional[Tuple]) -> List[Dict[str, Any]]:
+        # Run SELECT on a fresh dictionary cursor; errors propagate to the caller.
+        cursor = self.connection.cursor(dictionary=True)
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
     
     def _is_connected(self) -> bool:
         # Check if connection is active.
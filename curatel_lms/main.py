@@ -20,6 +20,7 @@ except ImportError:
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFontDatabase
+from curatel_lms.config import AppConfig
 from curatel_lms.ui.login_screen import LoginScreen
 from curatel_lms.database import Database
 
@@ -85,25 +86,7 @@ def main() -> None:
         
         print("[INFO] Application initialized")
         
-        app.setStyleSheet("""
-            QMessageBox {
-                background-color: #3C2A21;
-                color: white;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QMessageBox QPushButton {
-                background-color: #8B7E66;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 5px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #7A6D55;
-            }
-        """)
+        app.setStyleSheet(AppConfig.STYLES['global'])
 
         # Load fonts
         load_fonts()
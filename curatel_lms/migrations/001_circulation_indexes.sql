@@ -0,0 +1,8 @@
+-- curatel_lms/migrations/001_circulation_indexes.sql
+
+-- One-off index for the circulation screen's status filter; run once against db_library:
+--   mysql -u root db_library < curatel_lms/migrations/001_circulation_indexes.sql
+-- (status, borrow_id) serves "WHERE status = ? ORDER BY borrow_id DESC" and its keyset pages.
+-- book_id and member_id are already indexed by their foreign keys.
+
+CREATE INDEX idx_borrowed_books_status ON borrowed_books (status, borrow_id);
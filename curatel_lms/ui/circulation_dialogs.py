@@ -2,15 +2,122 @@
 
 # Provides dialog interfaces for adding, viewing, updating, and deleting transactions
 
+import sys
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QWidget,
-    QLineEdit, QPushButton, QComboBox, QMessageBox, QApplication
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGridLayout, QLabel, QWidget,
+    QLineEdit, QPushButton, QMessageBox, QApplication, QToolButton, QCalendarWidget, QComboBox
 )
-from PyQt6.QtCore import Qt, QDate
-from PyQt6.QtGui import QFont
-from datetime import datetime
+from PyQt6.QtCore import Qt, QDate, QDateTime, QTime, QLocale, QPoint, QRect
+from PyQt6.QtGui import QFont, QDoubleValidator
 from curatel_lms.config import AppConfig
 
+# Parsed by each dialog once instead of once per button
+_DIALOG_STYLE = AppConfig.get_dialog_style()
+
+_BUTTON_FONT = None
+
+def _button_font():
+    # Shared dialog button font, built once after QApplication exists
+    global _BUTTON_FONT
+    if _BUTTON_FONT is None:
+        _BUTTON_FONT = QFont("Montserrat", 18, QFont.Weight.Bold)
+    return _BUTTON_FONT
+
+_screen_center = None
+_watched_screens = set()
+
+def _reset_screen_center(*_args):
+    # Drop cached center after a screen change
+    global _screen_center
+    _screen_center = None
+
+def _centered_top_left(size):
+    # Top-left that centers a widget of this size on the primary screen
+    global _screen_center
+    if _screen_center is None:
+        app = QApplication.instance()
+        screen = app.primaryScreen()
+        if not _watched_screens:
+            app.primaryScreenChanged.connect(_reset_screen_center)
+        if screen.name() not in _watched_screens:
+            screen.geometryChanged.connect(_reset_screen_center)
+            _watched_screens.add(screen.name())
+        _screen_center = screen.geometry().center()
+    return _screen_center - QRect(QPoint(0, 0), size).center()
+
+class DateInput(QWidget):
+    # Masked YYYY-MM-DD field; the calendar popup is only built when first opened
+    
+    def __init__(self, parent=None):
+        # Init line edit and calendar button
+        super().__init__(parent)
+        self._calendar = None
+        self._minimum_date = QDate()
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(10)
+        
+        self.line_edit = QLineEdit()
+        self.line_edit.setInputMask("0000-00-00;_")
+        self.line_edit.setFixedHeight(AppConfig.FIELD_HEIGHT)
+        self.line_edit.setStyleSheet(AppConfig.STYLES['input'])
+        layout.addWidget(self.line_edit)
+        
+        self.calendar_btn = QToolButton()
+        self.calendar_btn.setText("▼")
+        self.calendar_btn.setFixedSize(AppConfig.FIELD_HEIGHT, AppConfig.FIELD_HEIGHT)
+        self.calendar_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.calendar_btn.setStyleSheet(AppConfig.STYLES['calendar_button'])
+        self.calendar_btn.clicked.connect(self._show_calendar)
+        layout.addWidget(self.calendar_btn)
+    
+    def date(self):
+        # Entered date; invalid QDate if empty or incomplete
+        return QDate.fromString(self.line_edit.text(), "yyyy-MM-dd")
+    
+    def setDate(self, qdate):
+        # Show date, or clear field for a null date
+        if qdate.isValid():
+            self.line_edit.setText(qdate.toString("yyyy-MM-dd"))
+        else:
+            self.line_edit.clear()
+    
+    def setMinimumDate(self, qdate):
+        # Earliest date the calendar offers
+        self._minimum_date = qdate
+        if self._calendar is not None:
+            self._calendar.setMinimumDate(qdate)
+    
+    def clear(self):
+        # Empty the field
+        self.line_edit.clear()
+    
+    def is_empty(self):
+        # True if no digits typed (mask separators only)
+        return not self.line_edit.text().replace('-', '').strip()
+    
+    def _show_calendar(self):
+        # Build calendar popup on first use, then show it under the field
+        if self._calendar is None:
+            self._calendar = QCalendarWidget(self)
+            self._calendar.setWindowFlags(Qt.WindowType.Popup)
+            self._calendar.setGridVisible(True)
+            self._calendar.setStyleSheet(AppConfig.STYLES['calendar_popup'])
+            if self._minimum_date.isValid():
+                self._calendar.setMinimumDate(self._minimum_date)
+            self._calendar.clicked.connect(self._pick_date)
+        
+        current = self.date()
+        self._calendar.setSelectedDate(current if current.isValid() else QDate.currentDate())
+        self._calendar.move(self.mapToGlobal(QPoint(0, self.height())))
+        self._calendar.show()
+    
+    def _pick_date(self, qdate):
+        # Copy calendar choice into field and close popup
+        self.setDate(qdate)
+        self._calendar.hide()
+
 class BaseTransactionDialog(QDialog):
     # Base dialog for transaction CRUD with shared UI/logic
     
@@ -30,13 +137,12 @@ class BaseTransactionDialog(QDialog):
         self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, False)
         self.setWindowFlag(Qt.WindowType.MSWindowsFixedSizeDialogHint)
         self.setFixedSize(AppConfig.DIALOG_WIDTH, AppConfig.DIALOG_HEIGHT)
-        self.setStyleSheet(f"background-color: {AppConfig.COLORS['bg_dialog']};")
+        self.setStyleSheet(_DIALOG_STYLE)
         self._center_on_screen()
     
     def _center_on_screen(self):
         # Center dialog on screen
-        screen_center = QApplication.primaryScreen().geometry().center()
-        self.move(screen_center - self.rect().center())
+        self.move(_centered_top_left(self.size()))
     
     def _create_header(self, text):
         # Create styled header widget
@@ -61,13 +167,20 @@ class BaseTransactionDialog(QDialog):
         container.setStyleSheet(AppConfig.STYLES['form_container'])
         return container
     
+    def _create_form_layout(self, container):
+        # Form layout with each label centered above its field
+        layout = QFormLayout(container)
+        layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
+        layout.setLabelAlignment(Qt.AlignmentFlag.AlignHCenter)
+        layout.setFormAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        return layout
+    
     def _add_field(self, layout, label_text, widget):
-        # Add labeled input field to layout
+        # Add labeled input field to form layout
         label = QLabel(label_text)
         label.setStyleSheet(AppConfig.STYLES['dialog_label'])
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(label)
-        layout.addWidget(widget)
+        layout.addRow(label, widget)
     
     def _create_buttons(self, primary_text, primary_callback):
         # Create primary + cancel button row
@@ -77,30 +190,30 @@ class BaseTransactionDialog(QDialog):
         
         primary_btn = QPushButton(primary_text)
         primary_btn.setFixedSize(AppConfig.BUTTON_WIDTH_EXTRA_WIDE, AppConfig.BUTTON_HEIGHT_LARGE)
-        primary_btn.setStyleSheet(AppConfig.get_green_button_style())
+        primary_btn.setProperty("cssClass", "green")
         primary_btn.clicked.connect(primary_callback)
         layout.addWidget(primary_btn)
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setFixedSize(AppConfig.BUTTON_WIDTH_EXTRA_WIDE, AppConfig.BUTTON_HEIGHT_LARGE)
-        cancel_btn.setStyleSheet(AppConfig.get_red_button_style())
+        cancel_btn.setProperty("cssClass", "red")
         cancel_btn.clicked.connect(self.reject)
         layout.addWidget(cancel_btn)
         layout.addStretch()
         return layout
     
-    @staticmethod
-    def _validate_date_format(date_string):
-        # Check if date string is YYYY-MM-DD
-        qdate = QDate.fromString(date_string, "yyyy-MM-dd")
-        return qdate.isValid()
-    
     @staticmethod
     def _format_date_for_display(date_value):
         # Convert date to string; empty if None
         if date_value is None or str(date_value).strip().lower() in ('none', 'null', ''):
             return ""
         return str(date_value)
+    
+    @classmethod
+    def _to_qdate(cls, date_value):
+        # Convert DB date/datetime to QDate; null QDate if None
+        date_text = cls._format_date_for_display(date_value).split(' ')[0]
+        return QDate.fromString(date_text, Qt.DateFormat.ISODate)
 
 class AddBorrowDialog(BaseTransactionDialog):
     # Dialog to create new borrow transaction
@@ -116,15 +229,14 @@ class AddBorrowDialog(BaseTransactionDialog):
         layout.setContentsMargins(0, 0, 0, 30)
         layout.setSpacing(0)
         
-        layout.addSpacing(-30)
         header = self._create_header("ADD TRANSACTION")
         layout.addWidget(header)
         layout.addSpacing(30)
         
         form_container = self._create_form_container(AppConfig.FORM_HEIGHT_MEDIUM)
-        form_layout = QVBoxLayout(form_container)
+        form_layout = self._create_form_layout(form_container)
         form_layout.setContentsMargins(30, 20, 30, 30)
-        form_layout.setSpacing(10)
+        form_layout.setVerticalSpacing(10)
         
         # Book ID input
         self.book_id_input = QLineEdit()
@@ -141,17 +253,13 @@ class AddBorrowDialog(BaseTransactionDialog):
         self._add_field(form_layout, "Member ID", self.member_id_input)
         
         # Borrow date input
-        self.borrow_date_input = QLineEdit()
-        self.borrow_date_input.setPlaceholderText("YYYY-MM-DD")
+        self.borrow_date_input = DateInput()
         self.borrow_date_input.setFixedSize(AppConfig.FIELD_WIDTH, AppConfig.FIELD_HEIGHT)
-        self.borrow_date_input.setStyleSheet(AppConfig.STYLES['input'])
         self._add_field(form_layout, "Borrow Date", self.borrow_date_input)
         
         # Due date input
-        self.due_date_input = QLineEdit()
-        self.due_date_input.setPlaceholderText("YYYY-MM-DD")
+        self.due_date_input = DateInput()
         self.due_date_input.setFixedSize(AppConfig.FIELD_WIDTH, AppConfig.FIELD_HEIGHT)
-        self.due_date_input.setStyleSheet(AppConfig.STYLES['input'])
         self._add_field(form_layout, "Due Date", self.due_date_input)
         
         container_layout = QHBoxLayout()
@@ -165,74 +273,98 @@ class AddBorrowDialog(BaseTransactionDialog):
         buttons = self._create_buttons("Save", self._save_transaction)
         layout.addLayout(buttons)
     
+    def reset(self):
+        # Clear inputs so a cached dialog can be reopened
+        self.book_id_input.clear()
+        self.member_id_input.clear()
+        self.borrow_date_input.clear()
+        self.due_date_input.clear()
+        self.book_id_input.setFocus()
+    
     def _save_transaction(self):
         # Validate and save new borrow record
-        book_id = self.book_id_input.text().strip()
-        member_id = self.member_id_input.text().strip()
-        borrow_date_text = self.borrow_date_input.text().strip()
-        due_date_text = self.due_date_input.text().strip()
+        book_id = sys.intern(self.book_id_input.text().strip())
+        member_id = sys.intern(self.member_id_input.text().strip())
         
-        if not all([book_id, member_id, borrow_date_text, due_date_text]):
+        if not book_id or not member_id or self.borrow_date_input.is_empty() or self.due_date_input.is_empty():
             QMessageBox.warning(self, "Validation Error", "All fields are required")
             return
         
-        if not self._validate_date_format(borrow_date_text):
+        borrow_qdate = self.borrow_date_input.date()
+        if not borrow_qdate.isValid():
             QMessageBox.warning(self, "Invalid Date", "Invalid Borrow Date format. Use YYYY-MM-DD.")
             return
         
-        if not self._validate_date_format(due_date_text):
+        due_qdate = self.due_date_input.date()
+        if not due_qdate.isValid():
             QMessageBox.warning(self, "Invalid Date", "Invalid Due Date format. Use YYYY-MM-DD.")
             return
         
-        now_time_str = datetime.now().strftime("%H:%M:%S")
+        if due_qdate <= borrow_qdate:
+            QMessageBox.warning(self, "Invalid Date", "Due Date must be after Borrow Date.")
+            return
+        
+        borrow_date_text = borrow_qdate.toString("yyyy-MM-dd")
+        due_date_text = due_qdate.toString("yyyy-MM-dd")
+        now_time_str = QTime.currentTime().toString("HH:mm:ss")
         borrow_date = f"{borrow_date_text} {now_time_str}"
         due_date = f"{due_date_text} {now_time_str}"
         
-        book_query = "SELECT book_id, status, title FROM books WHERE book_id = %s"
-        book = self.db.fetch_one(book_query, (book_id,))
+        # One round-trip validates both IDs; the probe row keeps missing IDs as NULLs
+        check_query = """
+            SELECT b.status AS book_status, b.title,
+                   m.status AS member_status, m.full_name
+            FROM (SELECT 1) AS probe
+            LEFT JOIN books b ON b.book_id = %s
+            LEFT JOIN members m ON m.member_id = %s
+        """
+        check = self.db.fetch_one(check_query, (book_id, member_id))
+        
+        if not check:
+            QMessageBox.critical(self, "Database Error", "Failed to validate transaction")
+            return
         
-        if not book:
+        if check['book_status'] is None:
             QMessageBox.warning(self, "Book Not Found", f"Book ID '{book_id}' does not exist.")
             return
         
-        if book['status'] != 'Available':
+        if check['book_status'] != 'Available':
             QMessageBox.warning(self, "Book Unavailable", 
-                              f"Book '{book['title']}' is currently {book['status']}.")
+                              f"Book '{check['title']}' is currently {check['book_status']}.")
             return
         
-        member_query = "SELECT member_id, status, full_name FROM members WHERE member_id = %s"
-        member = self.db.fetch_one(member_query, (member_id,))
-        
-        if not member:
+        if check['member_status'] is None:
             QMessageBox.warning(self, "Member Not Found", f"Member ID '{member_id}' does not exist.")
             return
         
-        if member['status'] != 'Active':
+        if check['member_status'] != 'Active':
             QMessageBox.warning(self, "Member Inactive", 
-                              f"Member '{member['full_name']}' is currently {member['status']}.")
+                              f"Member '{check['full_name']}' is currently {check['member_status']}.")
             return
         
-        query = """
+        insert_query = """
             INSERT INTO borrowed_books 
             (book_id, member_id, borrow_date, due_date, return_date, status, fine_amount)
             VALUES (%s, %s, %s, %s, NULL, 'Borrowed', 0.00)
         """
+        statements = [
+            (insert_query, (book_id, member_id, borrow_date, due_date)),
+            ("UPDATE books SET status='Borrowed' WHERE book_id=%s", (book_id,)),
+        ]
         
         try:
-            if self.db.execute_query(query, (book_id, member_id, borrow_date, due_date)):
-                self.db.execute_query("UPDATE books SET status='Borrowed' WHERE book_id=%s", (book_id,))
-                
+            if self.db.execute_transaction(statements):
                 QMessageBox.information(
                     self, "Success",
                     f"Transaction added successfully!\n\n"
-                    f"Book: {book['title']}\n"
-                    f"Member: {member['full_name']}\n"
+                    f"Book: {check['title']}\n"
+                    f"Member: {check['full_name']}\n"
                     f"Borrow Date: {borrow_date_text}\n"
                     f"Due Date: {due_date_text}"
                 )
                 
                 if self.callback:
-                    self.callback()
+                    self.callback(self.db.last_insert_id)
                 self.accept()
             else:
                 QMessageBox.critical(self, "Database Error", "Failed to add transaction")
@@ -261,24 +393,25 @@ class ViewBorrowDialog(BaseTransactionDialog):
         layout.addSpacing(40)
         
         info_container = self._create_form_container(AppConfig.FORM_HEIGHT_LARGE)
-        info_layout = QVBoxLayout(info_container)
+        info_layout = QGridLayout(info_container)
         info_layout.setContentsMargins(50, 20, 50, 20)
-        info_layout.setSpacing(20)
-        
-        self._add_info_field(info_layout, "Book ID:", self.transaction_data.get('book_id', ''))
-        self._add_info_field(info_layout, "Book Title:", self.transaction_data.get('book_title', 'Unknown'))
-        self._add_info_field(info_layout, "Member ID:", self.transaction_data.get('member_id', ''))
-        self._add_info_field(info_layout, "Member Name:", self.transaction_data.get('member_name', 'Unknown'))
-        self._add_info_field(info_layout, "Borrow Date:", str(self.transaction_data.get('borrow_date', '')))
-        self._add_info_field(info_layout, "Due Date:", str(self.transaction_data.get('due_date', '')))
-        
-        return_date = self.transaction_data.get('return_date')
-        return_date_display = str(return_date) if return_date else 'Not Returned'
-        self._add_info_field(info_layout, "Return Date:", return_date_display)
-        
-        self._add_info_field(info_layout, "Status:", self.transaction_data.get('status', ''))
-        
-        fine = f"₱{float(self.transaction_data.get('fine_amount', 0)):.2f}"
+        info_layout.setHorizontalSpacing(100)
+        info_layout.setVerticalSpacing(20)
+        info_layout.setColumnStretch(0, 1)
+        info_layout.setColumnStretch(1, 2)
+        
+        data = self.transaction_data
+        return_date = data.get('return_date')
+        fine = f"{AppConfig.PESO}{float(data.get('fine_amount', 0)):.2f}"
+        
+        self._add_info_field(info_layout, "Book ID:", data.get('book_id', ''))
+        self._add_info_field(info_layout, "Book Title:", data.get('book_title', 'Unknown'))
+        self._add_info_field(info_layout, "Member ID:", data.get('member_id', ''))
+        self._add_info_field(info_layout, "Member Name:", data.get('member_name', 'Unknown'))
+        self._add_info_field(info_layout, "Borrow Date:", data.get('borrow_date', ''))
+        self._add_info_field(info_layout, "Due Date:", data.get('due_date', ''))
+        self._add_info_field(info_layout, "Return Date:", return_date if return_date else 'Not Returned')
+        self._add_info_field(info_layout, "Status:", data.get('status', ''))
         self._add_info_field(info_layout, "Fine Amount:", fine)
         
         container_layout = QHBoxLayout()
@@ -294,9 +427,9 @@ class ViewBorrowDialog(BaseTransactionDialog):
         
         close_btn = QPushButton("Close")
         close_btn.setFixedSize(AppConfig.BUTTON_WIDTH_EXTRA_WIDE, AppConfig.BUTTON_HEIGHT_LARGE)
-        close_btn.setFont(QFont("Montserrat", 18, QFont.Weight.Bold))
+        close_btn.setFont(_button_font())
         close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        close_btn.setStyleSheet(AppConfig.get_red_button_style())
+        close_btn.setProperty("cssClass", "red")
         close_btn.clicked.connect(self.accept)
         button_layout.addWidget(close_btn)
         button_layout.addStretch()
@@ -304,13 +437,8 @@ class ViewBorrowDialog(BaseTransactionDialog):
         layout.addLayout(button_layout)
     
     def _add_info_field(self, layout, label_text, value_text):
-        # Add readonly label-value row
-        row = QWidget()
-        row.setStyleSheet("border: none; background: transparent;")
-        
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(100)
+        # Add readonly label-value row to the grid
+        row = layout.rowCount()
         
         label = QLabel(label_text)
         label.setStyleSheet(AppConfig.STYLES['dialog_label'])
@@ -321,10 +449,8 @@ class ViewBorrowDialog(BaseTransactionDialog):
         value.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         value.setWordWrap(True)
         
-        row_layout.addWidget(label, 1)
-        row_layout.addWidget(value, 2)
-        
-        layout.addWidget(row)
+        layout.addWidget(label, row, 0)
+        layout.addWidget(value, row, 1)
 
 class UpdateBorrowDialog(BaseTransactionDialog):
     # Dialog to edit return date, status, and fine
@@ -333,6 +459,12 @@ class UpdateBorrowDialog(BaseTransactionDialog):
         # Init update dialog
         super().__init__(parent, db, borrow_data, callback)
         
+        # IDs and status repeat across transactions; share one string each
+        for key in ('book_id', 'member_id', 'status'):
+            value = self.transaction_data.get(key)
+            if isinstance(value, str):
+                self.transaction_data[key] = sys.intern(value)
+        
         self._is_valid = bool(self.transaction_data and self.transaction_data.get("borrow_id"))
         
         self.setFixedSize(AppConfig.DIALOG_WIDTH, AppConfig.DIALOG_HEIGHT_COMPACT)
@@ -348,27 +480,20 @@ class UpdateBorrowDialog(BaseTransactionDialog):
             self._create_error_ui(layout)
             return
         
-        layout.addSpacing(-35)
         header = self._create_header("UPDATE TRANSACTION")
         layout.addWidget(header)
         layout.addSpacing(30)
         
         form_container = self._create_form_container(AppConfig.FORM_HEIGHT_COMPACT)
-        form_layout = QVBoxLayout(form_container)
+        form_layout = self._create_form_layout(form_container)
         form_layout.setContentsMargins(30, 10, 30, 30)
         
-        self.return_date_input = QLineEdit()
-        self.return_date_input.setPlaceholderText("YYYY-MM-DD")
+        self.return_date_input = DateInput()
         self.return_date_input.setFixedSize(AppConfig.FIELD_WIDTH, AppConfig.FIELD_HEIGHT)
-        self.return_date_input.setStyleSheet(AppConfig.STYLES['input'])
         
-        existing_return = self.transaction_data.get('return_date')
-        if existing_return and str(existing_return).strip().lower() not in ('none', 'null', ''):
-            try:
-                date_part = str(existing_return).split(' ')[0]
-                self.return_date_input.setText(date_part)
-            except Exception:
-                pass
+        self.borrow_qdate = self._to_qdate(self.transaction_data.get('borrow_date'))
+        self.return_date_input.setMinimumDate(self.borrow_qdate)
+        self.return_date_input.setDate(self._to_qdate(self.transaction_data.get('return_date')))
         
         self._add_field(form_layout, "Return Date", self.return_date_input)
         
@@ -384,14 +509,18 @@ class UpdateBorrowDialog(BaseTransactionDialog):
         self.fine_input.setFixedSize(AppConfig.FIELD_WIDTH, AppConfig.FIELD_HEIGHT)
         self.fine_input.setStyleSheet(AppConfig.STYLES['input'])
         
+        fine_validator = QDoubleValidator(0.0, 1_000_000.0, 2, self.fine_input)
+        fine_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        self.fine_input.setValidator(fine_validator)
+        
         existing_fine = self.transaction_data.get('fine_amount')
         if existing_fine is not None:
             try:
-                self.fine_input.setText(f"{float(existing_fine):.2f}")
+                self.fine_input.setText(QLocale().toString(float(existing_fine), 'f', 2))
             except (ValueError, TypeError):
                 pass
         
-        self._add_field(form_layout, "Fine Amount (₱)", self.fine_input)
+        self._add_field(form_layout, f"Fine Amount ({AppConfig.PESO})", self.fine_input)
         
         container_layout = QHBoxLayout()
         container_layout.addStretch()
@@ -421,7 +550,7 @@ class UpdateBorrowDialog(BaseTransactionDialog):
         
         close_btn = QPushButton("Close")
         close_btn.setFixedSize(AppConfig.BUTTON_WIDTH_EXTRA_WIDE, AppConfig.BUTTON_HEIGHT_LARGE)
-        close_btn.setStyleSheet(AppConfig.get_red_button_style())
+        close_btn.setProperty("cssClass", "red")
         close_btn.clicked.connect(self.reject)
         button_layout.addWidget(close_btn)
         button_layout.addStretch()
@@ -430,59 +559,76 @@ class UpdateBorrowDialog(BaseTransactionDialog):
     
     def _update_transaction(self):
         # Validate and save updated fields
-        return_date_text = self.return_date_input.text().strip()
+        return_qdate = self.return_date_input.date()
         status = self.status_combo.currentText()
         fine_text = self.fine_input.text().strip()
         
         return_date = None
-        if return_date_text:
-            if not self._validate_date_format(return_date_text):
+        if not self.return_date_input.is_empty():
+            if not return_qdate.isValid():
                 QMessageBox.warning(self, "Invalid Date", 
                                   "Invalid Return Date format. Use YYYY-MM-DD.")
                 return
-            return_date = f"{return_date_text} {datetime.now().strftime('%H:%M:%S')}"
+            if self.borrow_qdate.isValid() and return_qdate < self.borrow_qdate:
+                QMessageBox.warning(self, "Invalid Date", "Return Date cannot be before Borrow Date.")
+                return
+            return_date = f"{return_qdate.toString('yyyy-MM-dd')} {QTime.currentTime().toString('HH:mm:ss')}"
         
-        if status == "Returned" and not return_date_text:
+        if status == "Returned" and return_date is None:
             reply = QMessageBox.question(
                 self, 'Confirm Return Date',
                 "Status is 'Returned' but no Return Date is entered. Use today's date?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                today = QDate.currentDate().toString("yyyy-MM-dd")
-                return_date = f"{today} {datetime.now().strftime('%H:%M:%S')}"
+                return_date = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
             else:
                 return
         
-        try:
-            fine = float(fine_text) if fine_text else 0.0
-            if fine < 0:
-                QMessageBox.warning(self, "Invalid Fine", "Fine cannot be negative")
-                return
-        except ValueError:
+        fine, fine_ok = QLocale().toDouble(fine_text)
+        if fine_text and not fine_ok:
             QMessageBox.warning(self, "Invalid Fine", "Invalid fine amount")
             return
-        
+        if not fine_text:
+            fine = 0.0
+        if fine < 0:
+            QMessageBox.warning(self, "Invalid Fine", "Fine cannot be negative")
+            return
+
+        # Nothing edited: close without a database round-trip
+        old_return = self.transaction_data.get('return_date')
+        new = (return_date[:10] if return_date else None, status, round(fine, 2))
+        old = (str(old_return)[:10] if old_return else None,
+               self.transaction_data.get('status'),
+               round(float(self.transaction_data.get('fine_amount') or 0), 2))
+        if new == old:
+            self.accept()
+            return
+
         borrow_id = self.transaction_data.get("borrow_id")
         book_id = self.transaction_data.get('book_id')
         current_status = self.transaction_data.get('status')
         
-        if status == "Returned" and current_status != "Returned":
-            self.db.execute_query("UPDATE books SET status='Available' WHERE book_id=%s", (book_id,))
-        elif status != "Returned" and current_status == "Returned":
-            self.db.execute_query("UPDATE books SET status='Borrowed' WHERE book_id=%s", (book_id,))
-        
         query = """
             UPDATE borrowed_books
             SET return_date=%s, status=%s, fine_amount=%s
             WHERE borrow_id=%s
         """
+        statements = [(query, (return_date, status, fine, borrow_id))]
+        
+        # Book status only changes when the transaction crosses "Returned"
+        if (status == "Returned") != (current_status == "Returned"):
+            statements.append((
+                "UPDATE books SET status=CASE WHEN %s='Returned' THEN 'Available' ELSE 'Borrowed' END "
+                "WHERE book_id=%s",
+                (status, book_id)
+            ))
         
         try:
-            if self.db.execute_query(query, (return_date, status, fine, borrow_id)):
+            if self.db.execute_transaction(statements):
                 QMessageBox.information(self, "Success", "Transaction updated successfully!")
                 if self.callback:
-                    self.callback()
+                    self.callback(borrow_id)
                 self.accept()
             else:
                 QMessageBox.critical(self, "Database Error", "Failed to update transaction")
@@ -503,12 +649,21 @@ class ConfirmDeleteBorrowDialog(QDialog):
         self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, False)
         self.setWindowFlag(Qt.WindowType.MSWindowsFixedSizeDialogHint)
         self.setFixedSize(AppConfig.DIALOG_WIDTH, 500)
-        self.setStyleSheet(f"background-color: {AppConfig.COLORS['bg_dialog']};")
+        self.setStyleSheet(_DIALOG_STYLE)
         
-        screen_center = QApplication.primaryScreen().geometry().center()
-        self.move(screen_center - self.rect().center())
+        self.move(_centered_top_left(self.size()))
         
         self._setup_ui()
+        self.set_transaction(book_id, member_id)
+    
+    def set_transaction(self, book_id, member_id):
+        # Point the prompt at another transaction so the dialog can be reused
+        self.book_id = book_id
+        self.member_id = member_id
+        self.message_label.setText(
+            f"Are you sure you want to permanently delete:\n"
+            f"Book: {book_id} | Member: {member_id}?"
+        )
     
     def _setup_ui(self):
         # Build confirmation prompt with Yes/No
@@ -532,24 +687,16 @@ class ConfirmDeleteBorrowDialog(QDialog):
         
         frame = QWidget()
         frame.setFixedSize(600, 250)
-        frame.setStyleSheet(f"background-color: {AppConfig.COLORS['bg_dialog']}; border: none;")
+        frame.setObjectName("confirmFrame")
         frame_layout = QVBoxLayout(frame)
         frame_layout.setContentsMargins(30, 20, 30, 20)
         
-        message = QLabel(
-            f"Are you sure you want to permanently delete:\n"
-            f"Book: {self.book_id} | Member: {self.member_id}?"
-        )
-        message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message.setWordWrap(True)
-        message.setStyleSheet("""
-            font-family: Montserrat;
-            font-size: 20px;
-            border: none;
-            color: white;
-        """)
+        self.message_label = QLabel()
+        self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.message_label.setWordWrap(True)
+        self.message_label.setObjectName("confirmMsg")
         frame_layout.addStretch()
-        frame_layout.addWidget(message)
+        frame_layout.addWidget(self.message_label)
         frame_layout.addStretch()
         
         center_layout = QHBoxLayout()
@@ -567,13 +714,13 @@ class ConfirmDeleteBorrowDialog(QDialog):
         yes_btn = QPushButton("Yes")
         yes_btn.setFixedSize(AppConfig.BUTTON_WIDTH_EXTRA_WIDE, AppConfig.BUTTON_HEIGHT_LARGE)
         yes_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        yes_btn.setStyleSheet(AppConfig.get_red_button_style())
+        yes_btn.setProperty("cssClass", "red")
         yes_btn.clicked.connect(self.accept)
         
         no_btn = QPushButton("No")
         no_btn.setFixedSize(AppConfig.BUTTON_WIDTH_EXTRA_WIDE, AppConfig.BUTTON_HEIGHT_LARGE)
         no_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        no_btn.setStyleSheet(AppConfig.get_green_button_style())
+        no_btn.setProperty("cssClass", "green")
         no_btn.clicked.connect(self.reject)
         
         buttons_layout.addWidget(yes_btn)
@@ -2,40 +2,399 @@
 
 # Handles borrowing transactions with search, filtering, sorting, CRUD operations, and status updates
 
+import logging
+import traceback
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
+    QPushButton, QLineEdit, QTableView,
     QComboBox, QMessageBox, QHeaderView, QAbstractItemView, QDialog, QApplication
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QColor
-from curatel_lms.config import AppConfig
-from curatel_lms.ui.circulation_dialogs import (
-    AddBorrowDialog, ViewBorrowDialog, UpdateBorrowDialog, ConfirmDeleteBorrowDialog
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 )
+from PyQt6.QtGui import QFont, QColor, QBrush
+from curatel_lms.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+def _format_return_date(value):
+    if value is None:
+        return ''
+    text = str(value)
+    return '' if text.strip().lower() in ('none', 'null', '') else text
+
+def _format_text(value):
+    return '' if value is None else str(value)
+
+def _format_fine(value):
+    return f"{AppConfig.PESO}{value:.2f}"
+
+_COLUMN_FORMATTERS = {
+    'return_date': _format_return_date,
+    'fine_amount': _format_fine
+}
+_FORMATTERS = tuple(_COLUMN_FORMATTERS.get(key, _format_text) for key in AppConfig.CIRCULATION_TABLE['keys'])
+
+_DEFAULT_FG = QBrush(QColor(AppConfig.COLORS['text_dark']))
+_STATUS_FG = {
+    'Borrowed': QBrush(QColor(AppConfig.COLORS['status_borrowed'])),
+    'Returned': QBrush(QColor(AppConfig.COLORS['status_returned'])),
+    'Overdue': QBrush(QColor(AppConfig.COLORS['status_overdue']))
+}
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+_ALIGN = Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+_STATUS_COL = AppConfig.CIRCULATION_TABLE['keys'].index('status')
+
+def _sort_id(value):
+    if value is None:
+        return ('', -1)
+    prefix, _, number = str(value).rpartition('-')
+    if number.isdigit():
+        return (prefix.casefold(), int(number))
+    return (str(value).casefold(), -1)
+
+def _sort_fine(value):
+    return float(value or 0)
+
+def _sort_text(value):
+    return '' if value is None else str(value).casefold()
+
+_SORT_KEY_FACTORY = {
+    'book_id': _sort_id,
+    'member_id': _sort_id,
+    'fine_amount': _sort_fine
+}
+_SORT_KEYS = tuple(_SORT_KEY_FACTORY.get(key, _sort_text) for key in AppConfig.CIRCULATION_TABLE['keys'])
+
+class BorrowRow:
+    # Slotted transaction record with precomputed search text and sort keys; cell text is formatted on first paint.
+    FIELDS = ('borrow_id', 'book_id', 'member_id', 'borrow_date', 'due_date', 'return_date',
+              'status', 'fine_amount', 'updated_at', 'book_title', 'member_name')
+    __slots__ = FIELDS + ('display', 'search_blob', 'sort_keys')
+
+    def __init__(self, record):
+        self.update(record)
+
+    def update(self, record):
+        for field in self.FIELDS:
+            setattr(self, field, record.get(field))
+        self.fine_amount = float(self.fine_amount or 0)
+        self.display = None
+        keys = AppConfig.CIRCULATION_TABLE['keys']
+        self.search_blob = "\x1f".join(
+            value or '' for value in (self.book_id, self.member_id, self.book_title)
+        ).lower()
+        self.sort_keys = tuple(sort_key(getattr(self, key)) for sort_key, key in zip(_SORT_KEYS, keys))
+
+    def cells(self):
+        if self.display is None:
+            keys = AppConfig.CIRCULATION_TABLE['keys']
+            self.display = tuple(format_value(getattr(self, key)) for format_value, key in zip(_FORMATTERS, keys))
+        return self.display
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+class _FetchBorrowsSignals(QObject):
+    # Carries worker results back to the GUI thread
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+    batch = pyqtSignal(int, object)
+
+class _FetchBorrowsTask(QRunnable):
+    # Runs the transactions query on a pool thread
+    def __init__(self, db, query, params, generation, signals):
+        super().__init__()
+        self.db = db
+        self.query = query
+        self.params = params
+        self.generation = generation
+        self.signals = signals
+
+    def run(self):
+        try:
+            records = self.db.fetch_all_checked(self.query, self.params)
+        except Exception as e:
+            self._emit(self.signals.failed, str(e))
+            return
+        self._emit(self.signals.finished, records)
+
+    def _emit(self, signal, payload):
+        # The widget owning the signals may be gone by the time the query returns
+        try:
+            signal.emit(self.generation, payload)
+            return True
+        except RuntimeError:
+            return False
+
+class _StreamBorrowsTask(_FetchBorrowsTask):
+    # Streams the transactions query to the GUI thread in chunks, then reports the row count
+    def __init__(self, db, query, params, generation, signals, chunksize):
+        super().__init__(db, query, params, generation, signals)
+        self.chunksize = chunksize
+
+    def run(self):
+        chunks = self.db.fetch_iter(self.query, self.params, self.chunksize, AppConfig.QUERY_CACHE_TTL)
+        total = 0
+        try:
+            for chunk in chunks:
+                if not self._emit(self.signals.batch, chunk):
+                    return
+                total += len(chunk)
+        except Exception as e:
+            self._emit(self.signals.failed, str(e))
+            return
+        finally:
+            chunks.close()
+        self._emit(self.signals.finished, total)
+
+class BorrowsTableModel(QAbstractTableModel):
+    # Table model over the filtered transactions; serves each row's preformatted cell text.
+    more_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.has_more = False
+        self._rows = []
+        self._row_by_id = None
+        self._keys = AppConfig.CIRCULATION_TABLE['keys']
+        self._columns = AppConfig.CIRCULATION_TABLE['columns']
+        self._sort_column = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._sorted_as = None
+        self._font = QFont("Montserrat", 10)
+
+    def set_rows(self, rows):
+        self._row_by_id = None
+        self._sort_rows(rows)
+        if not (self._shrink_to(rows) or self._grow_to(rows)):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        self._rows = rows
+        if rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(self._keys) - 1))
+
+    def _shrink_to(self, rows):
+        old = self._rows
+        if len(rows) > len(old):
+            return False
+        runs = []
+        start = None
+        kept = 0
+        for row, borrow in enumerate(old):
+            if kept < len(rows) and rows[kept] is borrow:
+                kept += 1
+                if start is not None:
+                    runs.append((start, row))
+                    start = None
+            elif start is None:
+                start = row
+        if kept != len(rows):
+            return False
+        if start is not None:
+            runs.append((start, len(old)))
+        for first, end in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), first, end - 1)
+            del old[first:end]
+            self.endRemoveRows()
+        return True
+
+    def _grow_to(self, rows):
+        old = self._rows
+        runs = []
+        start = None
+        kept = 0
+        for row, borrow in enumerate(rows):
+            if kept < len(old) and old[kept] is borrow:
+                kept += 1
+                if start is not None:
+                    runs.append((start, row))
+                    start = None
+            elif start is None:
+                start = row
+        if kept != len(old):
+            return False
+        if start is not None:
+            runs.append((start, len(rows)))
+        for first, end in runs:
+            self.beginInsertRows(QModelIndex(), first, end - 1)
+            old[first:first] = rows[first:end]
+            self.endInsertRows()
+        return True
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        first = len(self._rows)
+        self._row_by_id = None
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._sorted_as = None
+        self.endInsertRows()
+        if self._sort_column is not None:
+            self.sort(self._sort_column, self._sort_order)
+
+    def borrow_at(self, row):
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def row_of(self, borrow_id):
+        if self._row_by_id is None:
+            self._row_by_id = {borrow.borrow_id: row for row, borrow in enumerate(self._rows)}
+        return self._row_by_id.get(borrow_id)
+
+    def refresh_row(self, row):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._keys) - 1))
+
+    def is_sorted(self):
+        return self._sort_column is not None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column if column >= 0 else None
+        self._sort_order = order
+        if self._sort_column is None or self._sorted_as == (column, order):
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        tracked = [(self._rows[index.row()], index.column()) for index in persistent]
+        self._sort_rows(self._rows)
+        self._row_by_id = None
+        positions = {id(borrow): row for row, borrow in enumerate(self._rows)}
+        self.changePersistentIndexList(
+            persistent, [self.index(positions[id(borrow)], col) for borrow, col in tracked]
+        )
+        self.layoutChanged.emit()
+
+    def _sort_rows(self, rows):
+        if self._sort_column is None:
+            self._sorted_as = None
+            return
+        column = self._sort_column
+        rows.sort(key=lambda borrow: borrow.sort_keys[column],
+                  reverse=(self._sort_order == Qt.SortOrder.DescendingOrder))
+        self._sorted_as = (column, self._sort_order)
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._row_by_id = None
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def canFetchMore(self, parent):
+        return self.has_more and not parent.isValid()
+
+    def fetchMore(self, parent):
+        if self.canFetchMore(parent):
+            self.has_more = False
+            self.more_requested.emit()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._rows[index.row()].cells()[index.column()]
+        if role == _FOREGROUND_ROLE:
+            if index.column() == _STATUS_COL:
+                return _STATUS_FG.get(self._rows[index.row()].status, _DEFAULT_FG)
+            return _DEFAULT_FG
+        if role == _ALIGNMENT_ROLE:
+            return _ALIGN
+        if role == _FONT_ROLE:
+            return self._font
+        return None
 
 class CirculationManagement(QWidget):
     # Main widget for managing library borrowing transactions with a sortable, filterable table and CRUD operations.
+    _BORROWS_QUERY = """
+        SELECT bb.borrow_id, bb.book_id, bb.member_id, bb.borrow_date, bb.due_date,
+               bb.return_date, bb.status, bb.fine_amount, bb.updated_at,
+               b.title as book_title, m.full_name as member_name
+        FROM borrowed_books bb
+        LEFT JOIN books b ON bb.book_id = b.book_id
+        LEFT JOIN members m ON bb.member_id = m.member_id
+    """
+    _FIRST_PAGE_QUERY = _BORROWS_QUERY + " ORDER BY bb.borrow_id DESC LIMIT %s"
+    _NEXT_PAGE_QUERY = _BORROWS_QUERY + " WHERE bb.borrow_id < %s ORDER BY bb.borrow_id DESC LIMIT %s"
+    _DETAIL_QUERY = _BORROWS_QUERY + " WHERE bb.borrow_id = %s"
+    _SEARCH_CONDITION = "(bb.book_id LIKE %s OR bb.member_id LIKE %s OR b.title LIKE %s)"
+
     def __init__(self, db=None):
         super().__init__()
         self.db = db
         self.all_borrows = []
+        self._borrows_by_id = {}
+        self._filtered_extra = {}
+        self._by_status = {}
+        self._last_filter_sig = None
         self.filtered_borrows = []
         self.selected_borrow_id = None
-        self.sort_column = None
-        self.sort_order = Qt.SortOrder.AscendingOrder
+        self._has_more_borrows = False
+        self._loading_page = False
+        self._load_generation = 0
+        self._fetch_signals = _FetchBorrowsSignals(self)
+        self._fetch_signals.finished.connect(self._on_borrows_loaded)
+        self._fetch_signals.failed.connect(self._on_borrows_failed)
+        self._fetch_signals.batch.connect(self._on_borrows_batch)
+        self._page_signals = _FetchBorrowsSignals(self)
+        self._page_signals.finished.connect(self._on_page_loaded)
+        self._page_signals.failed.connect(self._on_page_failed)
+        self._streamed_count = 0
+        self._filter_generation = 0
+        self._server_filtering = False
+        self._filter_active = False
+        self._filter_before_id = None
+        self._filter_has_more = False
+        self._loading_filtered = False
+        self._filter_replace = False
+        self._filter_signals = _FetchBorrowsSignals(self)
+        self._filter_signals.finished.connect(self._on_filtered_loaded)
+        self._filter_signals.failed.connect(self._on_filtered_failed)
+        self._add_borrow_dialog = None
+        self._confirm_delete_dialog = None
+        self._ui_font = QFont("Montserrat", 10)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(AppConfig.SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._filter_borrows)
         try:
             self._setup_ui()
-            self._load_borrows_from_database()
+            QTimer.singleShot(0, self._load_borrows_from_database)
         except Exception as e:
             print(f"[ERROR] Failed to setup Circulation Management: {e}")
-            import traceback
             traceback.print_exc()
             self._show_critical("Initialization Error", f"Failed to initialize Circulation Management:\n{str(e)}")
 
     def _setup_ui(self):
         self.setStyleSheet(f"background-color: {AppConfig.COLORS['bg_white']};")
-        main_layout = QVBoxLayout(self)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        content = QWidget()
+        content.setStyleSheet(
+            f"QLabel {{ color: {AppConfig.COLORS['text_dark']}; }}"
+            f"QLabel#circulationSubtitle {{ color: {AppConfig.COLORS['text_gray']}; }}"
+            + AppConfig.STYLES['search_input']
+            + AppConfig.STYLES['combo']
+            + AppConfig.STYLES['button']
+            + AppConfig.STYLES['table_with_corner']
+        )
+        outer_layout.addWidget(content)
+        main_layout = QVBoxLayout(content)
         main_layout.setContentsMargins(40, 20, 40, 30)
         main_layout.setSpacing(-5)
         main_layout.addLayout(self._create_header())
@@ -54,11 +413,10 @@ class CirculationManagement(QWidget):
         header_text = QVBoxLayout()
         title = QLabel("Circulation Management")
         title.setFont(QFont("Montserrat", 20, QFont.Weight.Bold))
-        title.setStyleSheet(f"color: {AppConfig.COLORS['text_dark']};")
         header_text.addWidget(title)
         subtitle = QLabel("Monitor issued books, returns, and charges")
         subtitle.setFont(QFont("Montserrat", 11))
-        subtitle.setStyleSheet(f"color: {AppConfig.COLORS['text_gray']};")
+        subtitle.setObjectName("circulationSubtitle")
         header_text.addWidget(subtitle)
         header_text.addSpacing(15)
         header_layout.addLayout(header_text)
@@ -69,9 +427,9 @@ class CirculationManagement(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by book id, member id, or book title")
-        self.search_input.setStyleSheet(AppConfig.STYLES['search_input'])
         self.search_input.setFixedHeight(AppConfig.SEARCH_HEIGHT)
-        self.search_input.textChanged.connect(self._filter_borrows)
+        self.search_input.textChanged.connect(self._schedule_filter)
+        self.search_input.returnPressed.connect(self._flush_filter)
         search_layout.addWidget(self.search_input)
         search_layout.addStretch()
         search_layout.addWidget(self._create_filter_label("Status"))
@@ -81,44 +439,47 @@ class CirculationManagement(QWidget):
 
     def _create_filter_label(self, text):
         label = QLabel(text)
-        label.setFont(QFont("Montserrat", 10))
-        label.setStyleSheet(f"color: {AppConfig.COLORS['text_dark']};")
+        label.setFont(self._ui_font)
         return label
 
     def _create_filter_combo(self, items):
         combo = QComboBox()
         combo.addItems(items)
-        combo.setStyleSheet(AppConfig.STYLES['combo'])
         combo.setFixedSize(120, AppConfig.SEARCH_HEIGHT)
         combo.currentTextChanged.connect(self._filter_borrows)
         return combo
 
     def _create_borrows_table(self):
-        self.borrows_table = QTableWidget()
-        self.borrows_table.setColumnCount(len(AppConfig.CIRCULATION_TABLE['columns']))
-        self.borrows_table.setSortingEnabled(False)
-        self.borrows_table.setHorizontalHeaderLabels(AppConfig.CIRCULATION_TABLE['columns'])
-        self.borrows_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.borrows_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.borrows_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.borrows_table.setAlternatingRowColors(True)
-        self.borrows_table.setStyleSheet(AppConfig.STYLES['table_with_corner'])
-        header = self.borrows_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.borrows_table = table = QTableView()
+        header = table.horizontalHeader()
+        vheader = table.verticalHeader()
+        self.borrows_model = BorrowsTableModel(table)
+        table.setModel(self.borrows_model)
+        self.borrows_model.more_requested.connect(self._fetch_more_borrows)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setAlternatingRowColors(True)
         header.setSectionsClickable(True)
         header.setStretchLastSection(True)
         header.setSectionsMovable(True)
         header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.sectionClicked.connect(self._handle_header_click)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        table.setSortingEnabled(True)
+        table.setUpdatesEnabled(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         for col, width in enumerate(AppConfig.CIRCULATION_TABLE['widths']):
-            self.borrows_table.setColumnWidth(col, width)
-        self.borrows_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
-        self.borrows_table.verticalHeader().setVisible(False)
-        self.borrows_table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.borrows_table.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.borrows_table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.borrows_table.itemSelectionChanged.connect(self._on_selection_changed)
-        return self.borrows_table
+            table.setColumnWidth(col, width)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        table.setUpdatesEnabled(True)
+        vheader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vheader.setDefaultSectionSize(AppConfig.ROW_HEIGHT)
+        vheader.setVisible(False)
+        table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        return table
 
     def _create_action_buttons(self):
         action_layout = QHBoxLayout()
@@ -136,20 +497,18 @@ class CirculationManagement(QWidget):
 
     def _create_action_button(self, text, callback, width=None):
         btn = QPushButton(text)
-        btn.setFont(QFont("Montserrat", 10))
+        btn.setFont(self._ui_font)
         button_width = width if width else AppConfig.BUTTON_WIDTH_STANDARD
         btn.setFixedSize(button_width, AppConfig.BUTTON_HEIGHT)
-        btn.setStyleSheet(AppConfig.STYLES['button'])
         btn.clicked.connect(callback)
         return btn
 
+    @pyqtSlot()
     def _on_selection_changed(self):
         try:
-            selected_row = self.borrows_table.currentRow()
-            if selected_row >= 0 and selected_row < len(self.filtered_borrows):
-                self.selected_borrow_id = self.filtered_borrows[selected_row]['borrow_id']
-            else:
-                self.selected_borrow_id = None
+            selected_rows = self.borrows_table.selectionModel().selectedRows()
+            borrow = self.borrows_model.borrow_at(selected_rows[0].row()) if selected_rows else None
+            self.selected_borrow_id = borrow.borrow_id if borrow is not None else None
         except Exception as e:
             print(f"[ERROR] Selection change failed: {e}")
             self.selected_borrow_id = None
@@ -166,79 +525,216 @@ class CirculationManagement(QWidget):
         except Exception as e:
             print(f"[WARN] Clear selection error: {e}")
 
-    def _handle_header_click(self, logical_index):
+    def _load_borrows_from_database(self):
+        if not self._validate_database_connection():
+            return
+        self._load_generation += 1
+        self._has_more_borrows = False
+        self._loading_page = False
+        self._streamed_count = 0
+        self._sync_fetch_more()
+        QThreadPool.globalInstance().start(
+            _StreamBorrowsTask(self.db, self._FIRST_PAGE_QUERY, (AppConfig.CIRCULATION_PAGE_SIZE,),
+                               self._load_generation, self._fetch_signals, AppConfig.FETCH_CHUNK_SIZE)
+        )
+
+    @pyqtSlot(int, object)
+    def _on_borrows_batch(self, generation, records):
+        if generation != self._load_generation:
+            return
         try:
-            if self.sort_column == logical_index:
-                self.sort_order = Qt.SortOrder.DescendingOrder if self.sort_order == Qt.SortOrder.AscendingOrder else Qt.SortOrder.AscendingOrder
+            if self._streamed_count == 0:
+                self.all_borrows = [BorrowRow(record) for record in records]
+                self._filtered_extra = {}
+                self._index_borrows()
+                self._last_filter_sig = None
+                self._filter_borrows()
             else:
-                self.sort_column = logical_index
-                self.sort_order = Qt.SortOrder.AscendingOrder
-            self._filter_borrows()
+                self._add_page(records)
+            self._streamed_count += len(records)
         except Exception as e:
-            print(f"[ERROR] Header click failed: {e}")
-            self._show_warning("Sort Error", "Failed to sort table")
+            print(f"[ERROR] Failed to load transactions: {e}")
+            traceback.print_exc()
 
-    def _load_borrows_from_database(self):
-        if not self._validate_database_connection():
+    @pyqtSlot(int, object)
+    def _on_borrows_loaded(self, generation, total):
+        if generation != self._load_generation:
             return
         try:
-            query = """
-                SELECT bb.*, b.title as book_title 
-                FROM borrowed_books bb
-                LEFT JOIN books b ON bb.book_id = b.book_id
-                ORDER BY bb.borrow_id DESC
-            """
-            self.all_borrows = self.db.fetch_all(query)
-            if self.all_borrows:
+            self._has_more_borrows = total == AppConfig.CIRCULATION_PAGE_SIZE
+            if total:
                 print(f"[OK] Loaded {len(self.all_borrows)} transactions")
-                self._filter_borrows()
+                search_text, status = self._last_filter_sig or ("", "All")
+                if self._has_more_borrows and self._filter_active and not self._server_filtering:
+                    self._load_borrows_filtered(search_text, status, self.all_borrows[-1].borrow_id)
             else:
                 print("[WARNING] No transactions found in database")
-                self.borrows_table.setRowCount(0)
+                self.all_borrows = []
+                self._index_borrows()
                 self.filtered_borrows = []
+                self.borrows_model.set_rows(self.filtered_borrows)
+            self._sync_fetch_more()
         except Exception as e:
             print(f"[ERROR] Failed to load transactions: {e}")
-            import traceback
             traceback.print_exc()
             self._show_critical("Database Error", f"Failed to load transactions from database:\n{str(e)}")
 
+    @pyqtSlot(int, str)
+    def _on_borrows_failed(self, generation, error):
+        if generation != self._load_generation:
+            return
+        print(f"[ERROR] Failed to load transactions: {error}")
+        self._show_critical("Database Error", f"Failed to load transactions from database:\n{error}")
+
+    def _sync_fetch_more(self):
+        if self._filter_active:
+            self.borrows_model.has_more = self._filter_has_more
+        else:
+            self.borrows_model.has_more = self._has_more_borrows
+
+    @pyqtSlot()
+    def _fetch_more_borrows(self):
+        if self._filter_active:
+            self._load_next_filtered()
+        else:
+            self._load_next_page()
+
+    def _load_next_page(self):
+        if not self.all_borrows or self._loading_page:
+            return
+        self._loading_page = True
+        params = (self.all_borrows[-1].borrow_id, AppConfig.CIRCULATION_PAGE_SIZE)
+        QThreadPool.globalInstance().start(
+            _FetchBorrowsTask(self.db, self._NEXT_PAGE_QUERY, params, self._load_generation, self._page_signals)
+        )
+
+    @pyqtSlot(int, object)
+    def _on_page_loaded(self, generation, records):
+        if generation != self._load_generation:
+            return
+        try:
+            self._has_more_borrows = len(records) == AppConfig.CIRCULATION_PAGE_SIZE
+            if records:
+                self._add_page(records)
+                print(f"[OK] Loaded {len(records)} more transactions")
+        except Exception as e:
+            print(f"[ERROR] Failed to load more transactions: {e}")
+            self._has_more_borrows = False
+        finally:
+            self._loading_page = False
+            self._sync_fetch_more()
+
+    @pyqtSlot(int, str)
+    def _on_page_failed(self, generation, error):
+        if generation != self._load_generation:
+            return
+        print(f"[ERROR] Failed to load more transactions: {error}")
+        self._has_more_borrows = False
+        self._loading_page = False
+        self._sync_fetch_more()
+        self._show_warning("Load Failed", "Could not load more transactions. Refresh to try again.")
+
+    def _add_page(self, records):
+        page = []
+        for record in records:
+            borrow = self._borrows_by_id.get(record['borrow_id']) or self._filtered_extra.pop(record['borrow_id'], None)
+            if borrow is None:
+                borrow = BorrowRow(record)
+            else:
+                borrow.update(record)
+            self._borrows_by_id[borrow.borrow_id] = borrow
+            self._by_status.setdefault(borrow.status, []).append(borrow)
+            page.append(borrow)
+        self.all_borrows.extend(page)
+        if self._server_filtering:
+            return
+        search_text = self.search_input.text().lower().strip()
+        status = self.status_combo.currentText()
+        row_of = self.borrows_model.row_of
+        self.borrows_model.append_rows([
+            borrow for borrow in page
+            if (status == "All" or borrow.status == status)
+            and self._borrow_matches_filters(borrow, search_text)
+            and row_of(borrow.borrow_id) is None
+        ])
+
+    def _index_borrows(self):
+        self._last_filter_sig = None
+        self._borrows_by_id = {borrow.borrow_id: borrow for borrow in self.all_borrows}
+        for borrow_id in self._borrows_by_id.keys() & self._filtered_extra.keys():
+            del self._filtered_extra[borrow_id]
+        self._by_status = {status: [] for status in AppConfig.TRANSACTION_STATUSES}
+        self._by_status['All'] = self.all_borrows
+        for borrow in self.all_borrows:
+            self._by_status.setdefault(borrow.status, []).append(borrow)
+
+    def _apply_row_change(self, borrow_id=None):
+        try:
+            fresh = None
+            if borrow_id is not None:
+                fresh = self.db.fetch_one_prepared(self._DETAIL_QUERY, (borrow_id,))
+            if not fresh:
+                self._load_borrows_from_database()
+                return
+            borrow = self._borrows_by_id.get(borrow_id)
+            if borrow is None:
+                extra = self._filtered_extra.get(borrow_id)
+                if extra is None:
+                    self.all_borrows.insert(0, BorrowRow(fresh))
+                    self._index_borrows()
+                else:
+                    extra.update(fresh)
+                    self._last_filter_sig = None
+                self._filter_borrows()
+                return
+            status_changed = borrow.status != fresh['status']
+            borrow.update(fresh)
+            if status_changed:
+                self._index_borrows()
+            row = self.borrows_model.row_of(borrow_id)
+            if row is None or status_changed or self.borrows_model.is_sorted():
+                self._last_filter_sig = None
+                self._filter_borrows()
+            else:
+                self.borrows_model.refresh_row(row)
+        except Exception as e:
+            print(f"[ERROR] Failed to apply transaction change: {e}")
+            self._load_borrows_from_database()
+
     def _display_borrows(self, borrows):
+        table = self.borrows_table
+        selection = table.selectionModel()
+        table.setUpdatesEnabled(False)
+        selection.blockSignals(True)
         try:
-            self.borrows_table.setRowCount(len(borrows))
-            for row, borrow in enumerate(borrows):
-                for col, key in enumerate(AppConfig.CIRCULATION_TABLE['keys']):
-                    value = borrow.get(key, '')
-                    if key == 'return_date':
-                        if value is None or str(value).strip().lower() in ('none', 'null', ''):
-                            value = ''
-                        else:
-                            value = str(value)
-                    elif key == 'fine_amount':
-                        value = f"₱{float(value):.2f}"
-                    else:
-                        value = str(value)
-                    item = self._create_table_item(value)
-                    if col == 6:
-                        status = borrow['status']
-                        if status == 'Borrowed':
-                            item.setForeground(QColor(AppConfig.COLORS['status_borrowed']))
-                        elif status == 'Returned':
-                            item.setForeground(QColor(AppConfig.COLORS['status_returned']))
-                        elif status == 'Overdue':
-                            item.setForeground(QColor(AppConfig.COLORS['status_overdue']))
-                    self.borrows_table.setItem(row, col, item)
+            self.borrows_model.set_rows(borrows)
+            self._restore_selection()
         except Exception as e:
             print(f"[ERROR] Display borrows failed: {e}")
-            import traceback
             traceback.print_exc()
+        finally:
+            selection.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _restore_selection(self):
+        if self.selected_borrow_id is None:
+            return
+        row = self.borrows_model.row_of(self.selected_borrow_id)
+        if row is None:
+            self.selected_borrow_id = None
+        else:
+            self.borrows_table.selectRow(row)
+
+    @pyqtSlot(str)
+    def _schedule_filter(self, _text=None):
+        self._filter_timer.start()
 
-    def _create_table_item(self, text):
-        item = QTableWidgetItem(text)
-        item.setFont(QFont("Montserrat", 10))
-        item.setForeground(QColor(AppConfig.COLORS['text_dark']))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        return item
+    @pyqtSlot()
+    def _flush_filter(self):
+        self._filter_timer.stop()
+        self._filter_borrows()
 
+    @pyqtSlot()
     def _filter_borrows(self):
         try:
             if not self.all_borrows:
@@ -246,45 +742,112 @@ class CirculationManagement(QWidget):
                 return
             search_text = self.search_input.text().lower().strip()
             status = self.status_combo.currentText()
-            filtered_borrows = [
-                borrow for borrow in self.all_borrows
-                if self._borrow_matches_filters(borrow, search_text, status)
-            ]
-            if self.sort_column is not None and filtered_borrows:
-                filtered_borrows = self._sort_borrows(filtered_borrows)
+            signature = (search_text, status)
+            if signature == self._last_filter_sig:
+                return
+            self._last_filter_sig = signature
+            self._filter_generation += 1
+            self._server_filtering = False
+            self._filter_active = bool(search_text) or status != "All"
+            self._filter_before_id = None
+            self._filter_has_more = False
+            self._loading_filtered = False
+            if self._filter_active and len(self.all_borrows) > AppConfig.SERVER_FILTER_THRESHOLD:
+                self._server_filtering = True
+                self._load_borrows_filtered(search_text, status)
+                self._sync_fetch_more()
+                return
+            self._sync_fetch_more()
+            candidates = self._by_status.get(status, [])
+            if search_text:
+                filtered_borrows = [borrow for borrow in candidates if search_text in borrow.search_blob]
+            else:
+                filtered_borrows = candidates[:]
             self.filtered_borrows = filtered_borrows
             self._display_borrows(filtered_borrows)
-            print(f"[INFO] Filtered to {len(filtered_borrows)} transactions")
+            if self._has_more_borrows and self._filter_active:
+                self._load_borrows_filtered(search_text, status, self.all_borrows[-1].borrow_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Filtered to %s transactions", len(filtered_borrows))
         except Exception as e:
             print(f"[ERROR] Filter borrows failed: {e}")
-            import traceback
             traceback.print_exc()
 
-    def _borrow_matches_filters(self, borrow, search_text, status):
-        if status != "All" and borrow['status'] != status:
-            return False
+    def _load_borrows_filtered(self, search_text, status, before_id=None):
+        conditions = []
+        params = []
+        if before_id is not None:
+            conditions.append("bb.borrow_id < %s")
+            params.append(before_id)
         if search_text:
-            searchable_fields = [
-                str(borrow.get('book_id', '')),
-                str(borrow.get('member_id', '')),
-                str(borrow.get('book_title', ''))
-            ]
-            if not any(search_text in field.lower() for field in searchable_fields):
-                return False
-        return True
+            pattern = "%" + search_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            conditions.append(self._SEARCH_CONDITION)
+            params += [pattern, pattern, pattern]
+        if status != "All":
+            conditions.append("bb.status = %s")
+            params.append(status)
+        params.append(AppConfig.CIRCULATION_PAGE_SIZE)
+        self._loading_filtered = True
+        self._filter_replace = before_id is None
+        query = self._BORROWS_QUERY + " WHERE " + " AND ".join(conditions) + " ORDER BY bb.borrow_id DESC LIMIT %s"
+        QThreadPool.globalInstance().start(
+            _FetchBorrowsTask(self.db, query, tuple(params), self._filter_generation, self._filter_signals)
+        )
+
+    @pyqtSlot(int, object)
+    def _on_filtered_loaded(self, generation, records):
+        if generation != self._filter_generation:
+            return
+        self._loading_filtered = False
+        self._filter_has_more = len(records) == AppConfig.CIRCULATION_PAGE_SIZE
+        if records:
+            self._filter_before_id = records[-1]['borrow_id']
+        borrows = []
+        for record in records:
+            borrow = self._find_borrow(record['borrow_id'])
+            if borrow is None:
+                borrow = BorrowRow(record)
+                self._filtered_extra[borrow.borrow_id] = borrow
+            borrows.append(borrow)
+        if self._filter_replace:
+            self.filtered_borrows = borrows
+            self._display_borrows(borrows)
+        else:
+            row_of = self.borrows_model.row_of
+            borrows = [borrow for borrow in borrows if row_of(borrow.borrow_id) is None]
+            self.borrows_model.append_rows(borrows)
+        self._sync_fetch_more()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Server filter returned %s transactions", len(borrows))
 
-    def _sort_borrows(self, borrows):
-        if self.sort_column < len(AppConfig.CIRCULATION_TABLE['keys']):
-            sort_key = AppConfig.CIRCULATION_TABLE['keys'][self.sort_column]
-            def sort_value(item):
-                value = item.get(sort_key)
-                if value is None:
-                    return ''
-                if sort_key == 'fine_amount':
-                    return float(value) if value else 0.0
-                return str(value).lower()
-            return sorted(borrows, key=sort_value, reverse=(self.sort_order == Qt.SortOrder.DescendingOrder))
-        return borrows
+    def _load_next_filtered(self):
+        if self._loading_filtered or self._filter_before_id is None or not self._last_filter_sig:
+            return
+        search_text, status = self._last_filter_sig
+        self._load_borrows_filtered(search_text, status, self._filter_before_id)
+
+    @pyqtSlot(int, str)
+    def _on_filtered_failed(self, generation, error):
+        if generation == self._filter_generation:
+            print(f"[ERROR] Server-side filter failed: {error}")
+            self._loading_filtered = False
+            self._filter_has_more = False
+            if self._filter_replace and self._last_filter_sig:
+                search_text, status = self._last_filter_sig
+                self._server_filtering = False
+                self.filtered_borrows = [
+                    borrow for borrow in self._by_status.get(status, [])
+                    if self._borrow_matches_filters(borrow, search_text)
+                ]
+                self._display_borrows(self.filtered_borrows)
+            self._sync_fetch_more()
+            self._show_warning("Search Failed", "Could not search all transactions; showing loaded results only.")
+
+    def _find_borrow(self, borrow_id):
+        return self._borrows_by_id.get(borrow_id) or self._filtered_extra.get(borrow_id)
+
+    def _borrow_matches_filters(self, borrow, search_text):
+        return not search_text or search_text in borrow.search_blob
 
     def _validate_database_connection(self):
         if not self.db or not self.db.connection:
@@ -299,28 +862,27 @@ class CirculationManagement(QWidget):
             return False
         return True
 
+    @pyqtSlot()
     def _add_borrow(self):
         try:
-            dialog = AddBorrowDialog(parent=self, db=self.db, callback=self._load_borrows_from_database)
-            dialog.exec()
+            if self._add_borrow_dialog is None:
+                from curatel_lms.ui.circulation_dialogs import AddBorrowDialog
+                self._add_borrow_dialog = AddBorrowDialog(parent=self, db=self.db, callback=self._apply_row_change)
+            self._add_borrow_dialog.reset()
+            self._add_borrow_dialog.exec()
         except Exception as e:
             print(f"[ERROR] Add transaction dialog failed: {e}")
             self._show_critical("Dialog Error", "Failed to open add transaction dialog")
 
+    @pyqtSlot()
     def _view_borrow(self):
         if not self._validate_selection():
             return
         try:
-            query = """
-                SELECT bb.*, b.title as book_title, m.full_name as member_name
-                FROM borrowed_books bb
-                LEFT JOIN books b ON bb.book_id = b.book_id
-                LEFT JOIN members m ON bb.member_id = m.member_id
-                WHERE bb.borrow_id = %s
-            """
-            borrow_data = self.db.fetch_one(query, (self.selected_borrow_id,))
+            borrow_data = self._find_borrow(self.selected_borrow_id)
             if borrow_data:
-                dialog = ViewBorrowDialog(parent=self, borrow_data=borrow_data)
+                from curatel_lms.ui.circulation_dialogs import ViewBorrowDialog
+                dialog = ViewBorrowDialog(parent=self, borrow_data=borrow_data.as_dict())
                 dialog.exec()
             else:
                 self._show_warning("Transaction Not Found", "Selected transaction not found in database")
@@ -329,20 +891,15 @@ class CirculationManagement(QWidget):
             print(f"[ERROR] View transaction failed: {e}")
             self._show_critical("View Error", f"Failed to view transaction:\n{str(e)}")
 
+    @pyqtSlot()
     def _update_borrow(self):
         if not self._validate_selection():
             return
         try:
-            query = """
-                SELECT bb.*, b.title as book_title, m.full_name as member_name
-                FROM borrowed_books bb
-                LEFT JOIN books b ON bb.book_id = b.book_id
-                LEFT JOIN members m ON bb.member_id = m.member_id
-                WHERE bb.borrow_id = %s
-            """
-            borrow_data = self.db.fetch_one(query, (self.selected_borrow_id,))
+            borrow_data = self._find_borrow(self.selected_borrow_id)
             if borrow_data:
-                dialog = UpdateBorrowDialog(parent=self, db=self.db, borrow_data=borrow_data, callback=self._load_borrows_from_database)
+                from curatel_lms.ui.circulation_dialogs import UpdateBorrowDialog
+                dialog = UpdateBorrowDialog(parent=self, db=self.db, borrow_data=borrow_data.as_dict(), callback=self._apply_row_change)
                 dialog.exec()
             else:
                 self._show_warning("Transaction Not Found", "Selected transaction not found in database")
@@ -351,34 +908,46 @@ class CirculationManagement(QWidget):
             print(f"[ERROR] Update transaction failed: {e}")
             self._show_critical("Update Error", f"Failed to update transaction:\n{str(e)}")
 
+    @pyqtSlot()
     def _delete_borrow(self):
         if not self._validate_selection():
             return
         try:
-            borrow_data = None
-            for borrow in self.filtered_borrows:
-                if borrow['borrow_id'] == self.selected_borrow_id:
-                    borrow_data = borrow
-                    break
+            borrow_data = self._find_borrow(self.selected_borrow_id)
             if not borrow_data:
                 self._show_warning("Transaction Not Found", "Selected transaction not found")
                 self._load_borrows_from_database()
                 return
-            book_id = borrow_data['book_id']
-            member_id = borrow_data['member_id']
-            dialog = ConfirmDeleteBorrowDialog(parent=self, book_id=book_id, member_id=member_id)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
+            book_id = borrow_data.book_id
+            member_id = borrow_data.member_id
+            if self._confirm_delete_dialog is None:
+                from curatel_lms.ui.circulation_dialogs import ConfirmDeleteBorrowDialog
+                self._confirm_delete_dialog = ConfirmDeleteBorrowDialog(parent=self)
+            self._confirm_delete_dialog.set_transaction(book_id, member_id)
+            if self._confirm_delete_dialog.exec() == QDialog.DialogCode.Accepted:
                 delete_query = "DELETE FROM borrowed_books WHERE borrow_id = %s"
                 if self.db.execute_query(delete_query, (self.selected_borrow_id,)):
-                    self._show_info("Delete Successful", f"Transaction for Book {book_id} and Member {member_id} has been deleted.")
+                    self._remove_borrow(borrow_data)
                     self.selected_borrow_id = None
-                    self._load_borrows_from_database()
+                    self._show_info("Delete Successful", f"Transaction for Book {book_id} and Member {member_id} has been deleted.")
                 else:
                     self._show_critical("Delete Failed", "Failed to delete transaction from database")
         except Exception as e:
             print(f"[ERROR] Delete transaction failed: {e}")
             self._show_critical("Delete Error", f"Failed to delete transaction:\n{str(e)}")
     
+    def _remove_borrow(self, borrow):
+        if borrow in self.all_borrows:
+            self.all_borrows.remove(borrow)
+        self._borrows_by_id.pop(borrow.borrow_id, None)
+        self._filtered_extra.pop(borrow.borrow_id, None)
+        bucket = self._by_status.get(borrow.status)
+        if bucket is not None and borrow in bucket:
+            bucket.remove(borrow)
+        row = self.borrows_model.row_of(borrow.borrow_id)
+        if row is not None:
+            self.borrows_model.remove_row(row)
+    
     def _show_fullscreen(self):
         self.setWindowState(Qt.WindowState.WindowMaximized)
         self.showMaximized()
@@ -387,80 +956,16 @@ class CirculationManagement(QWidget):
         event.accept()
 
     # Message Box Helpers
+    def _show_message(self, icon, title, text):
+        window = self.window()
+        box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, window if window is not self else None)
+        box.exec()
+
     def _show_warning(self, title, text):
-        msg = QMessageBox()
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #3C2A21;
-                color: white;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QMessageBox QPushButton {
-                background-color: #8B7E66;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 5px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #7A6D55;
-            }
-        """)
-        msg.exec()
+        self._show_message(QMessageBox.Icon.Warning, title, text)
 
     def _show_critical(self, title, text):
-        msg = QMessageBox()
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(QMessageBox.Icon.Critical)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #3C2A21;
-                color: white;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QMessageBox QPushButton {
-                background-color: #8B7E66;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 5px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #7A6D55;
-            }
-        """)
-        msg.exec()
+        self._show_message(QMessageBox.Icon.Critical, title, text)
 
     def _show_info(self, title, text):
-        msg = QMessageBox()
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(QMessageBox.Icon.Information)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #3C2A21;
-                color: white;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QMessageBox QPushButton {
-                background-color: #8B7E66;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 5px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #7A6D55;
-            }
-        """)
-        msg.exec()
\ No newline at end of file
+        self._show_message(QMessageBox.Icon.Information, title, text)